@@ -3,9 +3,9 @@
 import argparse
 import logging
 import sys
+from concurrent.futures import as_completed
 from pathlib import Path
 
-from .generator import SchemaGenerator
 from .schema_definitions import (
     get_schema_definition,
     list_schemas,
@@ -19,53 +19,126 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent schema generations in generate-all
+MAX_WORKERS = 8
+
+
+def _generate_in_worker(args, definition, output_dir: Path, existing=None) -> Path:
+    """Generate one schema from a worker thread.
+
+    Each worker uses its own generator instance; the underlying Weaviate
+    client is shared between them (see SchemaGenerator.connect). ``existing``
+    is the collection-name set primed once by generate_all_command.
+    """
+    from .generator import SchemaGenerator
+
+    generator = SchemaGenerator(
+        weaviate_url=args.weaviate_url,
+        pool_maxsize=args.pool_size,
+        init_timeout=args.init_timeout,
+        query_timeout=args.query_timeout,
+        insert_timeout=args.insert_timeout
+    )
+
+    if args.offline:
+        return generator.generate_schema_offline(definition, output_dir)
+
+    try:
+        generator.connect()
+        return generator.generate_schema(
+            definition=definition,
+            output_dir=output_dir,
+            cleanup=not args.no_cleanup,
+            existing=existing
+        )
+    finally:
+        generator.disconnect()
+
 
 def generate_all_command(args):
     """Generate all schemas of a specific priority."""
     output_dir = Path(args.output_dir).resolve()
-    logger.info(f"Generating all {args.priority} schemas to: {output_dir}")
+    logger.info("Generating all %s schemas to: %s", args.priority, output_dir)
 
-    generator = SchemaGenerator(weaviate_url=args.weaviate_url)
+    schemas = list_schemas(priority=args.priority)
+    logger.info("Found %s schemas to generate", len(schemas))
 
-    try:
-        generator.connect()
+    if not schemas:
+        return
 
-        schemas = list_schemas(priority=args.priority)
-        logger.info(f"Found {len(schemas)} schemas to generate")
+    # Imported here so commands that never talk to Weaviate (e.g. list) do
+    # not pay for importing the client library
+    from .generator import SchemaGenerator
+
+    generator = SchemaGenerator(
+        weaviate_url=args.weaviate_url,
+        pool_maxsize=args.pool_size,
+        init_timeout=args.init_timeout,
+        query_timeout=args.query_timeout,
+        insert_timeout=args.insert_timeout
+    )
 
-        for definition in schemas:
+    try:
+        # One list call up front replaces an exists() check per collection
+        existing = None
+        if not args.offline:
+            generator.connect()
+            existing = generator.prime_existing()
+
+        # Schemas are independent and generation is network-bound, so run them
+        # concurrently on the generators' shared thread pool.
+        executor = SchemaGenerator.get_executor(max_workers=min(len(schemas), MAX_WORKERS))
+
+        futures = {
+            executor.submit(_generate_in_worker, args, definition, output_dir, existing): definition
+            for definition in schemas
+        }
+
+        for future in as_completed(futures):
+            definition = futures[future]
             try:
-                schema_path = generator.generate_schema(
-                    definition=definition,
-                    output_dir=output_dir,
-                    cleanup=not args.no_cleanup
-                )
-                logger.info(f"✓ Generated: {definition.name}")
+                future.result()
+                logger.info("✓ Generated: %s", definition.name)
             except Exception as e:
-                logger.error(f"✗ Failed to generate {definition.name}: {e}")
+                logger.error("✗ Failed to generate %s: %s", definition.name, e)
                 if not args.continue_on_error:
+                    for pending in futures:
+                        pending.cancel()
                     raise
 
-        logger.info(f"Successfully generated {len(schemas)} schemas")
-
     finally:
         generator.disconnect()
 
+    logger.info("Successfully generated %s schemas", len(schemas))
+
 
 def generate_one_command(args):
     """Generate a specific schema by name."""
     output_dir = Path(args.output_dir).resolve()
     schema_name = args.schema_name
 
-    logger.info(f"Generating schema: {schema_name}")
+    logger.info("Generating schema: %s", schema_name)
 
     try:
         definition = get_schema_definition(schema_name)
     except ValueError as e:
-        logger.error(str(e))
+        logger.error("%s", e)
         return 1
 
-    generator = SchemaGenerator(weaviate_url=args.weaviate_url)
+    from .generator import SchemaGenerator
+
+    generator = SchemaGenerator(
+        weaviate_url=args.weaviate_url,
+        pool_maxsize=args.pool_size,
+        init_timeout=args.init_timeout,
+        query_timeout=args.query_timeout,
+        insert_timeout=args.insert_timeout
+    )
+
+    if args.offline:
+        schema_path = generator.generate_schema_offline(definition, output_dir)
+        logger.info("✓ Generated: %s -> %s", schema_name, schema_path)
+        return
 
     try:
         generator.connect()
@@ -76,7 +149,7 @@ def generate_one_command(args):
             cleanup=not args.no_cleanup
         )
 
-        logger.info(f"✓ Generated: {schema_name} -> {schema_path}")
+        logger.info("✓ Generated: %s -> %s", schema_name, schema_path)
 
     finally:
         generator.disconnect()
@@ -105,6 +178,30 @@ def main():
         default='http://localhost:8080',
         help='Weaviate instance URL (default: http://localhost:8080)'
     )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=32,
+        help='Maximum HTTP connections kept by the Weaviate client (default: 32)'
+    )
+    parser.add_argument(
+        '--init-timeout',
+        type=int,
+        default=30,
+        help='Seconds allowed for the initial Weaviate connection (default: 30)'
+    )
+    parser.add_argument(
+        '--query-timeout',
+        type=int,
+        default=60,
+        help='Seconds allowed for Weaviate read requests (default: 60)'
+    )
+    parser.add_argument(
+        '--insert-timeout',
+        type=int,
+        default=120,
+        help='Seconds allowed for Weaviate write requests (default: 120)'
+    )
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
@@ -128,6 +225,11 @@ def main():
         action='store_true',
         help='Do not delete collections after export'
     )
+    generate_all_parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Write definitions directly without creating them in Weaviate'
+    )
     generate_all_parser.add_argument(
         '--continue-on-error',
         action='store_true',
@@ -154,6 +256,11 @@ def main():
         action='store_true',
         help='Do not delete collection after export'
     )
+    generate_one_parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Write definitions directly without creating them in Weaviate'
+    )
     generate_one_parser.set_defaults(func=generate_one_command)
 
     # list command
@@ -177,7 +284,7 @@ def main():
         result = args.func(args)
         return result if result is not None else 0
     except Exception as e:
-        logger.error(f"Command failed: {e}", exc_info=True)
+        logger.error("Command failed: %s", e, exc_info=True)
         return 1
 
 
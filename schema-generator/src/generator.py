@@ -1,76 +1,304 @@
 """Schema generator - creates and exports baseline schemas from definitions."""
 
+import atexit
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, Optional, Set
 import weaviate
+from weaviate.classes.config import DataType, VectorDistances
+from weaviate.config import AdditionalConfig, ConnectionConfig, Timeout
+from weaviate.exceptions import WeaviateConnectionError, WeaviateTimeoutError
 
 from .schema_definitions import SchemaDefinition
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Attempts and initial backoff (seconds, doubled per retry) for creating a
+# collection when the request times out or the connection drops
+CREATE_ATTEMPTS = 3
+CREATE_BACKOFF = 0.5
+
+# Serialization options for JSON files written by the generator
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 if orjson else 0
+
+
+def _write_json(data: Dict[str, Any], path: Path):
+    """Write data to path as indented JSON in a single write."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=_ORJSON_OPTIONS))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+
+# Wire-format names (as used in collection configs) to client enums
+_DATATYPE_MAP: Dict[str, DataType] = {data_type.value: data_type for data_type in DataType}
+_DISTANCE_MAP: Dict[str, VectorDistances] = {distance.value: distance for distance in VectorDistances}
+
+
+def _resolve_data_type(name: str) -> DataType:
+    """Look up a DataType by its wire-format name (e.g. "text[]")."""
+    try:
+        return _DATATYPE_MAP[name]
+    except KeyError:
+        raise ValueError(f"Unknown data type: {name}. Available: {sorted(_DATATYPE_MAP)}") from None
+
+
+def _resolve_distance(name: str) -> VectorDistances:
+    """Look up a VectorDistances member by its wire-format name (e.g. "cosine")."""
+    try:
+        return _DISTANCE_MAP[name]
+    except KeyError:
+        raise ValueError(f"Unknown vector distance: {name}. Available: {sorted(_DISTANCE_MAP)}") from None
+
 
 class SchemaGenerator:
-    """Generates baseline schemas from definitions and exports them to JSON."""
+    """Generates baseline schemas from definitions and exports them to JSON.
 
-    def __init__(self, weaviate_url: str = "http://localhost:8080"):
+    All instances share a single Weaviate client. It is opened by the first
+    ``connect()`` and closed when the last connected instance disconnects.
+    """
+
+    _shared_client: ClassVar[Optional[weaviate.WeaviateClient]] = None
+    _refcount: ClassVar[int] = 0
+    _client_lock: ClassVar[threading.Lock] = threading.Lock()
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+
+    def __init__(
+        self,
+        weaviate_url: str = "http://localhost:8080",
+        pool_connections: int = 8,
+        pool_maxsize: int = 32,
+        init_timeout: int = 30,
+        query_timeout: int = 60,
+        insert_timeout: int = 120
+    ):
         """Initialize the schema generator.
 
         Args:
             weaviate_url: URL of the Weaviate instance
+            pool_connections: Number of connection pools kept by the client
+            pool_maxsize: Maximum connections per pool; size this to the
+                number of concurrent workers sharing the client
+            init_timeout: Seconds allowed for the initial connection checks
+            query_timeout: Seconds allowed for read requests
+            insert_timeout: Seconds allowed for write requests, including
+                collection creation
         """
         self.weaviate_url = weaviate_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.init_timeout = init_timeout
+        self.query_timeout = query_timeout
+        self.insert_timeout = insert_timeout
         self.client: Optional[weaviate.WeaviateClient] = None
 
+    @classmethod
+    def get_executor(cls, max_workers: int) -> ThreadPoolExecutor:
+        """Get the thread pool shared by all generators.
+
+        The pool is created on first use with ``max_workers`` threads and is
+        reused by later callers; it is shut down at interpreter exit.
+
+        Args:
+            max_workers: Number of worker threads if the pool is created now
+
+        Returns:
+            The shared executor
+        """
+        with cls._client_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="schema-generator"
+                )
+                atexit.register(cls._executor.shutdown)
+            return cls._executor
+
     def connect(self):
-        """Connect to Weaviate instance."""
-        try:
-            self.client = weaviate.connect_to_local(host="localhost", port=8080)
-            logger.info(f"Connected to Weaviate at {self.weaviate_url}")
-        except Exception as e:
-            logger.error(f"Failed to connect to Weaviate: {e}")
-            raise
+        """Connect to Weaviate instance, reusing the shared client if open."""
+        if self.client:
+            return
+
+        cls = type(self)
+        with cls._client_lock:
+            if cls._shared_client is None:
+                try:
+                    cls._shared_client = weaviate.connect_to_local(
+                        host="localhost",
+                        port=8080,
+                        additional_config=AdditionalConfig(
+                            connection=ConnectionConfig(
+                                session_pool_connections=self.pool_connections,
+                                session_pool_maxsize=self.pool_maxsize,
+                                session_pool_max_retries=3
+                            ),
+                            timeout=Timeout(
+                                init=self.init_timeout,
+                                query=self.query_timeout,
+                                insert=self.insert_timeout
+                            )
+                        )
+                    )
+                    logger.info("Connected to Weaviate at %s", self.weaviate_url)
+                except Exception as e:
+                    logger.error("Failed to connect to Weaviate: %s", e)
+                    raise
+
+            cls._refcount += 1
+            self.client = cls._shared_client
 
     def disconnect(self):
-        """Disconnect from Weaviate instance."""
-        if self.client:
-            self.client.close()
-            logger.info("Disconnected from Weaviate")
+        """Disconnect from Weaviate instance.
+
+        The shared client is only closed once no other instance is using it.
+        """
+        if not self.client:
+            return
+
+        cls = type(self)
+        with cls._client_lock:
+            self.client = None
+            cls._refcount -= 1
+
+            if cls._refcount == 0 and cls._shared_client is not None:
+                cls._shared_client.close()
+                cls._shared_client = None
+                logger.info("Disconnected from Weaviate")
+
+    def validate_definition(self, definition: SchemaDefinition):
+        """Check property data types and vector distances of a definition.
+
+        Runs locally, so an invalid definition fails before any request is
+        sent to Weaviate.
+
+        Args:
+            definition: Schema definition to validate
+
+        Raises:
+            ValueError: If a data type or distance metric is unknown
+        """
+        config = definition.collection_config
+
+        for prop in config.get("properties", []):
+            data_type = prop["dataType"][0]
+            # Cross-references name a collection, which always starts uppercase
+            if not data_type[:1].isupper():
+                _resolve_data_type(data_type)
+
+        vector_index_configs = [
+            vector_def.get("vectorIndexConfig", {})
+            for vector_def in config.get("vectorConfig", {}).values()
+        ]
+        if "vectorIndexConfig" in config:
+            vector_index_configs.append(config["vectorIndexConfig"])
+
+        for vector_index_config in vector_index_configs:
+            if "distance" in vector_index_config:
+                _resolve_distance(vector_index_config["distance"])
 
-    def create_collection_from_definition(self, definition: SchemaDefinition) -> str:
+    def prime_existing(self) -> Set[str]:
+        """Fetch the names of all collections currently in Weaviate.
+
+        The returned set can be passed as ``existing`` to the create/cleanup
+        methods so they check membership locally instead of issuing one
+        ``exists`` request per collection.
+
+        Returns:
+            Set of existing collection names
+        """
+        if not self.client:
+            raise RuntimeError("Not connected to Weaviate. Call connect() first.")
+
+        return set(self.client.collections.list_all().keys())
+
+    def _collection_exists(self, collection_name: str, existing: Optional[Set[str]]) -> bool:
+        """Check for a collection, locally if a primed set is available."""
+        if existing is not None:
+            return collection_name in existing
+        return self.client.collections.exists(collection_name)
+
+    def create_collection_from_definition(
+        self,
+        definition: SchemaDefinition,
+        existing: Optional[Set[str]] = None
+    ):
         """Create a collection in Weaviate from a schema definition.
 
         Args:
             definition: Schema definition to create
+            existing: Optional set from prime_existing(); kept up to date
 
         Returns:
-            Collection name that was created
+            Handle to the created collection
         """
         if not self.client:
             raise RuntimeError("Not connected to Weaviate. Call connect() first.")
 
-        config = definition.collection_config
+        self.validate_definition(definition)
+
+        config = definition.config_dict()
         collection_name = config["name"]
 
         # Delete collection if it already exists
-        if self.client.collections.exists(collection_name):
-            logger.info(f"Deleting existing collection: {collection_name}")
+        if self._collection_exists(collection_name, existing):
+            logger.info("Deleting existing collection: %s", collection_name)
             self.client.collections.delete(collection_name)
+            if existing is not None:
+                existing.discard(collection_name)
 
-        logger.info(f"Creating collection: {collection_name}")
+        logger.info("Creating collection: %s", collection_name)
 
         # Create collection directly from dictionary
         try:
-            self.client.collections.create_from_dict(config)
-            logger.info(f"Successfully created collection: {collection_name}")
-            return collection_name
+            collection = self._create_with_retry(config)
+            if existing is not None:
+                existing.add(collection_name)
+            logger.info("Successfully created collection: %s", collection_name)
+            return collection
 
         except Exception as e:
-            logger.error(f"Failed to create collection {collection_name}: {e}")
+            logger.error("Failed to create collection %s: %s", collection_name, e)
             raise
 
+    def _create_with_retry(self, config: Dict[str, Any]):
+        """Create a collection, retrying timeouts with exponential backoff.
+
+        A timed-out request may still have created the collection, so before
+        each retry the collection is looked up and reused if present.
+
+        Args:
+            config: Collection configuration dictionary
+
+        Returns:
+            The created collection
+        """
+        collection_name = config["name"]
+        delay = CREATE_BACKOFF
+
+        for attempt in range(1, CREATE_ATTEMPTS + 1):
+            try:
+                if attempt > 1 and self.client.collections.exists(collection_name):
+                    return self.client.collections.get(collection_name)
+                return self.client.collections.create_from_dict(config)
+            except (WeaviateTimeoutError, WeaviateConnectionError) as e:
+                if attempt == CREATE_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "Creating %s failed (attempt %d/%d): %s; retrying in %.1fs",
+                    collection_name, attempt, CREATE_ATTEMPTS, e, delay
+                )
+                time.sleep(delay)
+                delay *= 2
+
     def export_collection_schema(self, collection_name: str) -> Dict[str, Any]:
         """Export a collection's schema configuration.
 
@@ -90,11 +318,11 @@ class SchemaGenerator:
             # Convert to dictionary
             exported = config.to_dict()
 
-            logger.info(f"Exported schema for collection: {collection_name}")
+            logger.info("Exported schema for collection: %s", collection_name)
             return exported
 
         except Exception as e:
-            logger.error(f"Failed to export schema for {collection_name}: {e}")
+            logger.error("Failed to export schema for %s: %s", collection_name, e)
             raise
 
     def save_schema_to_file(self, schema: Dict[str, Any], output_path: Path):
@@ -102,36 +330,59 @@ class SchemaGenerator:
 
         Args:
             schema: Schema dictionary to save
-            output_path: Path to save the JSON file
+            output_path: Path to save the JSON file; its parent directory
+                must already exist
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(schema, output_path)
 
-        with open(output_path, 'w') as f:
-            json.dump(schema, f, indent=2)
+        logger.info("Saved schema to: %s", output_path)
 
-        logger.info(f"Saved schema to: {output_path}")
+    def save_metadata(
+        self,
+        definition: SchemaDefinition,
+        schema_dir: Path,
+        collection_name: str
+    ):
+        """Save a schema's metadata.json next to its config.
 
-    def cleanup_collection(self, collection_name: str):
+        Args:
+            definition: Schema definition the metadata describes
+            schema_dir: Directory of the generated schema
+            collection_name: Name of the Weaviate collection
+        """
+        metadata = {
+            "name": definition.name,
+            "description": definition.description,
+            "priority": definition.priority,
+            "collection_name": collection_name
+        }
+        _write_json(metadata, schema_dir / "metadata.json")
+
+    def cleanup_collection(self, collection_name: str, existing: Optional[Set[str]] = None):
         """Delete a collection from Weaviate.
 
         Args:
             collection_name: Name of the collection to delete
+            existing: Optional set from prime_existing(); kept up to date
         """
         if not self.client:
             return
 
         try:
-            if self.client.collections.exists(collection_name):
+            if self._collection_exists(collection_name, existing):
                 self.client.collections.delete(collection_name)
-                logger.info(f"Deleted collection: {collection_name}")
+                if existing is not None:
+                    existing.discard(collection_name)
+                logger.info("Deleted collection: %s", collection_name)
         except Exception as e:
-            logger.warning(f"Failed to delete collection {collection_name}: {e}")
+            logger.warning("Failed to delete collection %s: %s", collection_name, e)
 
     def generate_schema(
         self,
         definition: SchemaDefinition,
         output_dir: Path,
-        cleanup: bool = True
+        cleanup: bool = True,
+        existing: Optional[Set[str]] = None
     ) -> Path:
         """Generate a baseline schema from a definition.
 
@@ -139,39 +390,67 @@ class SchemaGenerator:
             definition: Schema definition to generate from
             output_dir: Directory to save the schema JSON
             cleanup: Whether to delete the collection after export
+            existing: Optional set from prime_existing(); kept up to date
 
         Returns:
             Path to the generated schema file
         """
-        logger.info(f"Generating schema: {definition.name}")
+        logger.info("Generating schema: %s", definition.name)
+
+        schema_dir = output_dir / definition.name
+        schema_dir.mkdir(parents=True, exist_ok=True)
 
         # Create collection
-        collection_name = self.create_collection_from_definition(definition)
+        collection = self.create_collection_from_definition(definition, existing)
+        collection_name = definition.collection_config["name"]
 
         try:
-            # Export schema
-            schema = self.export_collection_schema(collection_name)
+            # Export schema from the handle returned by create, which saves
+            # the collections.get() lookup done by export_collection_schema
+            schema = collection.config.get().to_dict()
+            logger.info("Exported schema for collection: %s", collection_name)
 
             # Save to file
-            schema_dir = output_dir / definition.name
             schema_path = schema_dir / "config.json"
             self.save_schema_to_file(schema, schema_path)
 
             # Save metadata
-            metadata = {
-                "name": definition.name,
-                "description": definition.description,
-                "priority": definition.priority,
-                "collection_name": collection_name
-            }
-            metadata_path = schema_dir / "metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
-            logger.info(f"Successfully generated schema: {definition.name}")
+            self.save_metadata(definition, schema_dir, collection_name)
+
+            logger.info("Successfully generated schema: %s", definition.name)
             return schema_path
 
         finally:
             # Cleanup
             if cleanup:
-                self.cleanup_collection(collection_name)
+                self.cleanup_collection(collection_name, existing)
+
+    def generate_schema_offline(
+        self,
+        definition: SchemaDefinition,
+        output_dir: Path
+    ) -> Path:
+        """Generate a schema straight from its definition, without Weaviate.
+
+        The definition's collection_config is written as-is, so server-filled
+        defaults are not included. No connection is required.
+
+        Args:
+            definition: Schema definition to generate from
+            output_dir: Directory to save the schema JSON
+
+        Returns:
+            Path to the generated schema file
+        """
+        logger.info("Generating schema offline: %s", definition.name)
+
+        self.validate_definition(definition)
+
+        schema_dir = output_dir / definition.name
+        schema_dir.mkdir(parents=True, exist_ok=True)
+        schema_path = schema_dir / "config.json"
+        self.save_schema_to_file(definition.config_dict(), schema_path)
+        self.save_metadata(definition, schema_dir, definition.collection_config["name"])
+
+        logger.info("Successfully generated schema: %s", definition.name)
+        return schema_path
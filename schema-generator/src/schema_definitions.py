@@ -6,17 +6,64 @@ Priority Levels:
 - P2: Advanced schemas (future)
 """
 
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
 
-@dataclass
+def _thaw(value: Any) -> Any:
+    """Recursively copy read-only mappings into plain dicts."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class SchemaDefinition:
-    """Represents a complete schema definition for testing."""
+    """Represents a complete schema definition for testing.
+
+    collection_config may contain shared read-only sub-configs; use
+    config_dict() to get a plain, JSON-serializable copy.
+    """
     name: str
     description: str
     priority: str
-    collection_config: Dict[str, Any]
+    collection_config: Dict[str, Any] = field(hash=False)
+
+    def config_dict(self) -> Dict[str, Any]:
+        """Return collection_config as a plain nested dict."""
+        return _thaw(self.collection_config)
+
+
+# Sub-configs shared by several definitions. They are read-only so one
+# definition cannot change another's config through a shared object.
+
+_DEFAULT_HNSW_COSINE = MappingProxyType({
+    "ef": -1,
+    "efConstruction": 128,
+    "maxConnections": 32,
+    "dynamicEfMin": 100,
+    "dynamicEfMax": 500,
+    "dynamicEfFactor": 8,
+    "skip": False,
+    "flatSearchCutoff": 40000,
+    "distance": "cosine"
+})
+
+_DEFAULT_HNSW_DOT = MappingProxyType({**_DEFAULT_HNSW_COSINE, "distance": "dot"})
+
+_DEFAULT_REPLICATION = MappingProxyType({
+    "factor": 1
+})
+
+_DEFAULT_INVERTED = MappingProxyType({
+    "indexNullState": False,
+    "indexPropertyLength": False,
+    "indexTimestamps": False
+})
 
 
 # P0 Schemas: Basic functionality tests
@@ -48,30 +95,14 @@ P0_BASIC_TEXT_ONLY = SchemaDefinition(
         "vectorConfig": {
             "default": {
                 "vectorIndexType": "hnsw",
-                "vectorIndexConfig": {
-                    "ef": -1,
-                    "efConstruction": 128,
-                    "maxConnections": 32,
-                    "dynamicEfMin": 100,
-                    "dynamicEfMax": 500,
-                    "dynamicEfFactor": 8,
-                    "skip": False,
-                    "flatSearchCutoff": 40000,
-                    "distance": "cosine"
-                },
+                "vectorIndexConfig": _DEFAULT_HNSW_COSINE,
                 "vectorizer": {
                     "none": {}
                 }
             }
         },
-        "replicationConfig": {
-            "factor": 1
-        },
-        "invertedIndexConfig": {
-            "indexNullState": False,
-            "indexPropertyLength": False,
-            "indexTimestamps": False
-        }
+        "replicationConfig": _DEFAULT_REPLICATION,
+        "invertedIndexConfig": _DEFAULT_INVERTED
     }
 )
 
@@ -97,30 +128,14 @@ P0_SINGLE_NAMED_VECTOR = SchemaDefinition(
         "vectorConfig": {
             "default": {
                 "vectorIndexType": "hnsw",
-                "vectorIndexConfig": {
-                    "ef": -1,
-                    "efConstruction": 128,
-                    "maxConnections": 32,
-                    "dynamicEfMin": 100,
-                    "dynamicEfMax": 500,
-                    "dynamicEfFactor": 8,
-                    "skip": False,
-                    "flatSearchCutoff": 40000,
-                    "distance": "cosine"
-                },
+                "vectorIndexConfig": _DEFAULT_HNSW_COSINE,
                 "vectorizer": {
                     "none": {}
                 }
             }
         },
-        "replicationConfig": {
-            "factor": 1
-        },
-        "invertedIndexConfig": {
-            "indexNullState": False,
-            "indexPropertyLength": False,
-            "indexTimestamps": False
-        }
+        "replicationConfig": _DEFAULT_REPLICATION,
+        "invertedIndexConfig": _DEFAULT_INVERTED
     }
 )
 
@@ -146,47 +161,21 @@ P0_MULTI_NAMED_VECTORS = SchemaDefinition(
         "vectorConfig": {
             "text_vector": {
                 "vectorIndexType": "hnsw",
-                "vectorIndexConfig": {
-                    "ef": -1,
-                    "efConstruction": 128,
-                    "maxConnections": 32,
-                    "dynamicEfMin": 100,
-                    "dynamicEfMax": 500,
-                    "dynamicEfFactor": 8,
-                    "skip": False,
-                    "flatSearchCutoff": 40000,
-                    "distance": "cosine"
-                },
+                "vectorIndexConfig": _DEFAULT_HNSW_COSINE,
                 "vectorizer": {
                     "none": {}
                 }
             },
             "description_vector": {
                 "vectorIndexType": "hnsw",
-                "vectorIndexConfig": {
-                    "ef": -1,
-                    "efConstruction": 128,
-                    "maxConnections": 32,
-                    "dynamicEfMin": 100,
-                    "dynamicEfMax": 500,
-                    "dynamicEfFactor": 8,
-                    "skip": False,
-                    "flatSearchCutoff": 40000,
-                    "distance": "dot"
-                },
+                "vectorIndexConfig": _DEFAULT_HNSW_DOT,
                 "vectorizer": {
                     "none": {}
                 }
             }
         },
-        "replicationConfig": {
-            "factor": 1
-        },
-        "invertedIndexConfig": {
-            "indexNullState": False,
-            "indexPropertyLength": False,
-            "indexTimestamps": False
-        }
+        "replicationConfig": _DEFAULT_REPLICATION,
+        "invertedIndexConfig": _DEFAULT_INVERTED
     }
 )
 
@@ -206,14 +195,26 @@ def get_schema_definition(name: str) -> SchemaDefinition:
     return SCHEMA_DEFINITIONS[name]
 
 
-def list_schemas(priority: str = None) -> List[SchemaDefinition]:
+def _index_by_priority(definitions) -> Dict[str, Tuple[SchemaDefinition, ...]]:
+    """Group definitions by priority in a single pass."""
+    index: Dict[str, list] = {}
+    for definition in definitions:
+        index.setdefault(definition.priority, []).append(definition)
+    return {priority: tuple(group) for priority, group in index.items()}
+
+
+# Lookup tables built once at import time
+_ALL: Tuple[SchemaDefinition, ...] = tuple(SCHEMA_DEFINITIONS.values())
+_BY_PRIORITY = _index_by_priority(_ALL)
+
+
+def list_schemas(priority: Optional[str] = None) -> Tuple[SchemaDefinition, ...]:
     """List all schema definitions, optionally filtered by priority."""
-    schemas = list(SCHEMA_DEFINITIONS.values())
     if priority:
-        schemas = [s for s in schemas if s.priority == priority]
-    return schemas
+        return _BY_PRIORITY.get(priority, ())
+    return _ALL
 
 
-def get_p0_schemas() -> List[SchemaDefinition]:
+def get_p0_schemas() -> Tuple[SchemaDefinition, ...]:
     """Get all P0 (basic) schema definitions."""
-    return list_schemas(priority="P0")
+    return _BY_PRIORITY.get("P0", ())
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Cross-client schema comparison script."""
 
-import json
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TextIO, Tuple
 import argparse
 
 # Add test-clients/python to path
@@ -13,41 +15,52 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 sys.path.insert(0, str(PROJECT_ROOT / "test-clients" / "python" / "src"))
 
 from comparator import SchemaComparator
+from json_utils import dumps, dumps_bytes, load_json
 
 
-def find_exported_schemas(results_dir: Path) -> Dict[str, Dict[str, Path]]:
+def _find_config_file(schema_dir: str) -> Optional[str]:
+    """Return the path of config.json inside schema_dir, if it is a file."""
+    with os.scandir(schema_dir) as entries:
+        for entry in entries:
+            if entry.name == "config.json" and entry.is_file():
+                return entry.path
+    return None
+
+
+def find_exported_schemas(results_dir: str) -> Dict[str, Dict[str, str]]:
     """Find all exported schemas organized by client and schema name.
 
     Returns:
         Dict with structure: {client_name: {schema_name: schema_path}}
     """
-    exported_dir = results_dir / "exported-schemas"
+    exported_dir = os.path.join(results_dir, "exported-schemas")
     schemas = {}
 
-    if not exported_dir.exists():
+    if not os.path.isdir(exported_dir):
         return schemas
 
-    for client_dir in exported_dir.iterdir():
-        if not client_dir.is_dir():
-            continue
-
-        client_name = client_dir.name
-        schemas[client_name] = {}
-
-        for schema_dir in client_dir.iterdir():
-            if not schema_dir.is_dir():
+    # DirEntry caches the file type from the directory listing, so this walk
+    # avoids a stat() call per entry
+    with os.scandir(exported_dir) as client_entries:
+        for client_entry in client_entries:
+            if not client_entry.is_dir():
                 continue
 
-            schema_name = schema_dir.name
-            config_file = schema_dir / "config.json"
+            client_schemas = schemas[client_entry.name] = {}
 
-            if config_file.exists():
-                schemas[client_name][schema_name] = config_file
+            with os.scandir(client_entry.path) as schema_entries:
+                for schema_entry in schema_entries:
+                    if not schema_entry.is_dir():
+                        continue
+
+                    config_file = _find_config_file(schema_entry.path)
+                    if config_file:
+                        client_schemas[schema_entry.name] = config_file
 
     return schemas
 
 
-def load_baseline_schemas(schemas_dir: Path) -> Dict[str, Path]:
+def load_baseline_schemas(schemas_dir: str) -> Dict[str, str]:
     """Load all baseline schema paths.
 
     Returns:
@@ -55,33 +68,82 @@ def load_baseline_schemas(schemas_dir: Path) -> Dict[str, Path]:
     """
     baselines = {}
 
-    for schema_dir in schemas_dir.iterdir():
-        if not schema_dir.is_dir():
-            continue
+    with os.scandir(schemas_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
 
-        config_file = schema_dir / "config.json"
-        if config_file.exists():
-            baselines[schema_dir.name] = config_file
+            config_file = _find_config_file(entry.path)
+            if config_file:
+                baselines[entry.name] = config_file
 
     return baselines
 
 
+# Below this many (schema, client) pairs, comparisons run serially. A pair
+# takes about 100us in process, while the pool adds several ms of worker
+# startup plus about 35us of IPC per pair, so with 2-4 workers it only
+# breaks even somewhere around 1000 pairs
+PARALLEL_THRESHOLD = 1000
+
+# (schema_name, baseline_path, client_name, exported_path)
+ComparisonTask = Tuple[str, str, str, str]
+
+# Per-process comparator for pool workers, so each worker keeps its own
+# baseline file cache across the tasks it is given
+_worker_comparator: Optional[SchemaComparator] = None
+
+
+def _init_worker(exhaustive: bool):
+    """Create the comparator used by compare tasks in a pool worker."""
+    global _worker_comparator
+    _worker_comparator = SchemaComparator(exhaustive=exhaustive)
+
+
+def _compare_in_worker(task: ComparisonTask) -> Dict[str, Any]:
+    """Run one comparison task in a pool worker."""
+    return _compare_pair(_worker_comparator, task)
+
+
+def _compare_pair(comparator: SchemaComparator, task: ComparisonTask) -> Dict[str, Any]:
+    """Compare one exported schema file against its baseline file."""
+    schema_name, baseline_path, client_name, exported_path = task
+
+    match, differences = comparator.compare_schemas(
+        comparator.load_file(baseline_path),
+        load_json(exported_path),
+        schema_name,
+        client=client_name
+    )
+
+    return {
+        'schema_name': schema_name,
+        'client': client_name,
+        'match': match,
+        'differences': differences,
+        'baseline_path': baseline_path,
+        'exported_path': exported_path
+    }
+
+
 def compare_all_schemas(
-    baselines: Dict[str, Path],
-    exported: Dict[str, Dict[str, Path]],
+    baselines: Dict[str, str],
+    exported: Dict[str, Dict[str, str]],
     comparator: SchemaComparator
 ) -> List[Dict[str, Any]]:
     """Compare all exported schemas against baselines.
 
+    Comparisons run in a process pool once there are at least
+    PARALLEL_THRESHOLD of them, and serially with comparator otherwise.
+
     Returns:
         List of comparison results
     """
-    results = []
+    results: List[Optional[Dict[str, Any]]] = []
+    # (index into results, task) for every pair that has an exported schema
+    tasks: List[Tuple[int, ComparisonTask]] = []
 
     for schema_name, baseline_path in baselines.items():
-        with open(baseline_path) as f:
-            baseline = json.load(f)
-
         for client_name, client_schemas in exported.items():
             if schema_name not in client_schemas:
                 results.append({
@@ -93,121 +155,138 @@ def compare_all_schemas(
                 })
                 continue
 
-            exported_path = client_schemas[schema_name]
-            with open(exported_path) as f:
-                exported_schema = json.load(f)
-
-            match, differences = comparator.compare_schemas(
-                baseline,
-                exported_schema,
-                f"{client_name}/{schema_name}"
-            )
-
-            results.append({
-                'schema_name': schema_name,
-                'client': client_name,
-                'match': match,
-                'differences': differences,
-                'baseline_path': str(baseline_path),
-                'exported_path': str(exported_path)
-            })
+            task = (schema_name, baseline_path, client_name, client_schemas[schema_name])
+            tasks.append((len(results), task))
+            results.append(None)
+
+    if len(tasks) < PARALLEL_THRESHOLD:
+        # Baselines are parsed once through the comparator's file cache
+        for index, task in tasks:
+            results[index] = _compare_pair(comparator, task)
+        return results
+
+    workers = min(os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(comparator.exhaustive,)
+    ) as pool:
+        compared = pool.map(
+            _compare_in_worker,
+            [task for _, task in tasks],
+            chunksize=max(1, len(tasks) // (workers * 4))
+        )
+        for (index, _), result in zip(tasks, compared):
+            results[index] = result
 
     return results
 
 
-def generate_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Generate summary statistics."""
-    total = len(results)
-    passed = sum(1 for r in results if r['match'])
-    failed = total - passed
+def generate_summary(
+    results: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Generate summary statistics.
 
-    # Per-client stats
-    clients = {}
-    for result in results:
-        client = result['client']
-        if client not in clients:
-            clients[client] = {'total': 0, 'passed': 0, 'failed': 0}
+    Returns:
+        Tuple of (summary, failed results)
+    """
+    # Per-client and per-schema counters as [total, passed, failed], filled
+    # in a single pass over the results
+    clients = defaultdict(lambda: [0, 0, 0])
+    schemas = defaultdict(lambda: [0, 0, 0])
+    failures = []
 
-        clients[client]['total'] += 1
+    for result in results:
         if result['match']:
-            clients[client]['passed'] += 1
+            outcome = 1
         else:
-            clients[client]['failed'] += 1
+            outcome = 2
+            failures.append(result)
 
-    # Per-schema stats
-    schemas = {}
-    for result in results:
-        schema = result['schema_name']
-        if schema not in schemas:
-            schemas[schema] = {'total': 0, 'passed': 0, 'failed': 0}
+        client = clients[result['client']]
+        client[0] += 1
+        client[outcome] += 1
 
-        schemas[schema]['total'] += 1
-        if result['match']:
-            schemas[schema]['passed'] += 1
-        else:
-            schemas[schema]['failed'] += 1
+        schema = schemas[result['schema_name']]
+        schema[0] += 1
+        schema[outcome] += 1
 
-    return {
+    total = len(results)
+    passed = total - len(failures)
+
+    summary = {
         'total': total,
         'passed': passed,
-        'failed': failed,
+        'failed': total - passed,
         'pass_rate': (passed / total * 100) if total > 0 else 0,
-        'clients': clients,
-        'schemas': schemas
+        'clients': _counters_to_stats(clients),
+        'schemas': _counters_to_stats(schemas)
     }
+    return summary, failures
+
+
+def _counters_to_stats(counters: Dict[str, List[int]]) -> Dict[str, Dict[str, int]]:
+    """Convert [total, passed, failed] counters to the summary's stats dicts."""
+    return {
+        name: {'total': total, 'passed': passed, 'failed': failed}
+        for name, (total, passed, failed) in counters.items()
+    }
+
+
+def _write_group_stats(
+    groups: Dict[str, Dict[str, int]],
+    total_label: str,
+    out: TextIO
+):
+    """Write one markdown section per client or schema stats entry."""
+    for name, stats in groups.items():
+        total, passed, failed = stats['total'], stats['passed'], stats['failed']
+        pass_rate = (passed / total * 100) if total > 0 else 0
+        status = "✅" if failed == 0 else "❌"
+        print(f"### {name} {status}", file=out)
+        print(f"- {total_label}: {total}", file=out)
+        print(f"- Passed: {passed}", file=out)
+        print(f"- Failed: {failed}", file=out)
+        print(f"- Pass Rate: {pass_rate:.1f}%\n", file=out)
 
 
 def generate_markdown_report(
     summary: Dict[str, Any],
-    results: List[Dict[str, Any]]
-) -> str:
-    """Generate markdown report."""
-    lines = []
-
-    lines.append("# Schema Comparison Report\n")
-    lines.append("## Summary\n")
-    lines.append(f"- Total Tests: {summary['total']}")
-    lines.append(f"- Passed: {summary['passed']} ✅")
-    lines.append(f"- Failed: {summary['failed']} ❌")
-    lines.append(f"- Pass Rate: {summary['pass_rate']:.1f}%\n")
-
-    lines.append("## Results by Client\n")
-    for client, stats in summary['clients'].items():
-        pass_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-        status = "✅" if stats['failed'] == 0 else "❌"
-        lines.append(f"### {client} {status}")
-        lines.append(f"- Total: {stats['total']}")
-        lines.append(f"- Passed: {stats['passed']}")
-        lines.append(f"- Failed: {stats['failed']}")
-        lines.append(f"- Pass Rate: {pass_rate:.1f}%\n")
-
-    lines.append("## Results by Schema\n")
-    for schema, stats in summary['schemas'].items():
-        pass_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-        status = "✅" if stats['failed'] == 0 else "❌"
-        lines.append(f"### {schema} {status}")
-        lines.append(f"- Total Clients: {stats['total']}")
-        lines.append(f"- Passed: {stats['passed']}")
-        lines.append(f"- Failed: {stats['failed']}")
-        lines.append(f"- Pass Rate: {pass_rate:.1f}%\n")
+    failures: List[Dict[str, Any]],
+    out: TextIO
+):
+    """Write the markdown report to out, a writable text stream.
+
+    Lines are written as they are produced, so the full report (including
+    every failure's JSON differences) is never held in memory at once.
+    """
+    print("# Schema Comparison Report\n", file=out)
+    print("## Summary\n", file=out)
+    print(f"- Total Tests: {summary['total']}", file=out)
+    print(f"- Passed: {summary['passed']} ✅", file=out)
+    print(f"- Failed: {summary['failed']} ❌", file=out)
+    print(f"- Pass Rate: {summary['pass_rate']:.1f}%\n", file=out)
+
+    print("## Results by Client\n", file=out)
+    _write_group_stats(summary['clients'], "Total", out)
+
+    print("## Results by Schema\n", file=out)
+    _write_group_stats(summary['schemas'], "Total Clients", out)
 
     # Show failures in detail
-    failures = [r for r in results if not r['match']]
     if failures:
-        lines.append("## Detailed Failures\n")
+        print("## Detailed Failures\n", file=out)
         for failure in failures:
-            lines.append(f"### {failure['client']} / {failure['schema_name']}\n")
+            print(f"### {failure['client']} / {failure['schema_name']}\n", file=out)
 
             if 'error' in failure:
-                lines.append(f"**Error:** {failure['error']}\n")
+                print(f"**Error:** {failure['error']}\n", file=out)
             else:
-                lines.append("**Differences:**\n")
-                lines.append(f"```json\n{json.dumps(failure['differences'], indent=2)}\n```\n")
+                print("**Differences:**\n", file=out)
+                print(f"```json\n{dumps(failure['differences'])}\n```\n", file=out)
     else:
-        lines.append("## Cross-Language Consistency\n")
-        lines.append("✅ All clients produced identical schemas for all test cases.\n")
-
-    return "\n".join(lines)
+        print("## Cross-Language Consistency\n", file=out)
+        print("✅ All clients produced identical schemas for all test cases.\n", file=out)
 
 
 def main():
@@ -232,12 +311,19 @@ def main():
         type=Path,
         help='Output path for comparison report (default: test-results/comparisons/report.md)'
     )
+    parser.add_argument(
+        '--exhaustive',
+        action='store_true',
+        help='Diff with DeepDiff instead of the built-in comparator (slow, for debugging)'
+    )
 
     args = parser.parse_args()
 
-    results_dir = args.results_dir
-    schemas_dir = args.schemas_dir
-    output_path = args.output or (results_dir / "comparisons" / "report.md")
+    # Paths are plain strings from here on; os.path is cheaper than pathlib
+    results_dir = os.fspath(args.results_dir)
+    schemas_dir = os.fspath(args.schemas_dir)
+    output_path = os.fspath(args.output or os.path.join(results_dir, "comparisons", "report.md"))
+    output_dir = os.path.dirname(output_path) or os.curdir
 
     print("Loading schemas...")
     baselines = load_baseline_schemas(schemas_dir)
@@ -255,26 +341,25 @@ def main():
         return 1
 
     print("\nComparing schemas...")
-    comparator = SchemaComparator()
+    comparator = SchemaComparator(exhaustive=args.exhaustive)
     results = compare_all_schemas(baselines, exported, comparator)
 
     print("\nGenerating report...")
-    summary = generate_summary(results)
-    report = generate_markdown_report(summary, results)
+    summary, failures = generate_summary(results)
 
     # Save report
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     with open(output_path, 'w') as f:
-        f.write(report)
+        generate_markdown_report(summary, failures, f)
     print(f"Report saved to: {output_path}")
 
     # Save JSON summary
-    json_path = output_path.parent / "summary.json"
-    with open(json_path, 'w') as f:
-        json.dump({
+    json_path = os.path.join(output_dir, "summary.json")
+    with open(json_path, 'wb') as f:
+        f.write(dumps_bytes({
             'summary': summary,
             'results': results
-        }, f, indent=2)
+        }))
     print(f"JSON summary saved to: {json_path}")
 
     # Print summary
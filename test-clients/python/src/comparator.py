@@ -2,14 +2,231 @@
 
 import json
 import logging
-from typing import Dict, Any, List, Tuple
+import os
+import re
+from collections import Counter
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
 from pathlib import Path
-from deepdiff import DeepDiff
+
+from json_utils import dumps, load_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _copy_json(node: Any) -> Any:
+    """Deep-copy a parsed JSON value; scalars are immutable and returned as-is."""
+    if isinstance(node, dict):
+        return {key: _copy_json(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_json(value) for value in node]
+    return node
+
+
+# A schema path as a tuple of dict keys and list indices, e.g. ('properties', 0)
+SchemaPath = Tuple[Any, ...]
+
+
+def _format_path(path: SchemaPath) -> str:
+    """Format a path the way DeepDiff does, e.g. root['properties'][0]."""
+    return "root" + "".join(f"[{part!r}]" for part in path)
+
+
+def _parse_path(path: str) -> SchemaPath:
+    """Parse a DeepDiff path string such as root['a']['b'] into ('a', 'b')."""
+    return tuple(re.findall(r"\['([^']*)'\]", path))
+
+
+def _with_default(node: Dict[str, Any], path: SchemaPath, default: Any) -> Dict[str, Any]:
+    """Return node with default set at path if missing.
+
+    Dicts along the path are copied only when a value has to be filled in,
+    so the input is never mutated. Paths running into a non-dict are skipped.
+    """
+    key = path[0]
+    if len(path) == 1:
+        return node if key in node else {**node, key: default}
+
+    child = node.get(key, {})
+    if not isinstance(child, dict):
+        return node
+    filled = _with_default(child, path[1:], default)
+    if filled is child and key in node:
+        return node
+    return {**node, key: filled}
+
+
+def _by_name(items: List[Any]) -> Optional[Dict[str, Any]]:
+    """Map each item's name to the item, if all are dicts with unique string names.
+
+    Returns None for anything else (e.g. missing, duplicate or non-string
+    names), so such lists fall back to multiset matching.
+    """
+    by_name: Dict[str, Any] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        name = item.get('name')
+        if not isinstance(name, str) or name in by_name:
+            return None
+        by_name[name] = item
+    return by_name
+
+
+def _diff(
+    a: Any,
+    b: Any,
+    path: SchemaPath = (),
+    ignore: FrozenSet[SchemaPath] = frozenset()
+) -> Iterator[Tuple[SchemaPath, str, Any, Any]]:
+    """Yield (path, kind, baseline_value, exported_value) for each difference.
+
+    Dicts are compared key by key, skipping any key path in ignore. Lists
+    are compared ignoring order: lists of uniquely named dicts are matched
+    by name, other lists as multisets of their key-order-independent form.
+    """
+    if type(a) is not type(b):
+        yield path, 'type_changes', a, b
+        return
+
+    # Only identity is a safe shortcut: == treats 1, 1.0 and True as equal,
+    # which would hide exactly the serialization drift being checked for
+    if a is b:
+        return
+
+    if isinstance(a, dict):
+        for key, value in a.items():
+            child = path + (key,)
+            if child in ignore:
+                continue
+            if key in b:
+                yield from _diff(value, b[key], child, ignore)
+            else:
+                yield child, 'dictionary_item_removed', value, None
+        for key, value in b.items():
+            if key not in a and path + (key,) not in ignore:
+                yield path + (key,), 'dictionary_item_added', None, value
+
+    elif isinstance(a, list):
+        yield from _diff_lists(a, b, path, ignore)
+
+    elif a != b:
+        yield path, 'values_changed', a, b
+
+
+def _canonical(item: Any) -> str:
+    """Serialize a JSON value independently of its dict key order."""
+    return json.dumps(item, sort_keys=True)
+
+
+def _unmatched(keyed: List[Tuple[str, Any]], matched: Dict[str, int]) -> List[Tuple[int, Any]]:
+    """(index, item) for items beyond the matched count of their canonical key."""
+    seen: Counter = Counter()
+    left = []
+    for index, (key, item) in enumerate(keyed):
+        seen[key] += 1
+        if seen[key] > matched.get(key, 0):
+            left.append((index, item))
+    return left
+
+
+def _diff_lists(
+    a: List[Any],
+    b: List[Any],
+    path: SchemaPath,
+    ignore: FrozenSet[SchemaPath]
+) -> Iterator[Tuple[SchemaPath, str, Any, Any]]:
+    """Compare two lists ignoring order (see _diff)."""
+    a_by_name = _by_name(a)
+    b_by_name = _by_name(b) if a_by_name is not None else None
+    if b_by_name is not None:
+        for index, name in enumerate(sorted(a_by_name)):
+            if name in b_by_name:
+                yield from _diff(a_by_name[name], b_by_name[name], path + (index,), ignore)
+            else:
+                yield path + (index,), 'iterable_item_removed', a_by_name[name], None
+        for index, name in enumerate(sorted(b_by_name)):
+            if name not in a_by_name:
+                yield path + (index,), 'iterable_item_added', None, b_by_name[name]
+        return
+
+    # Sorted by a key-order-independent form, since clients serialize dict
+    # keys in different orders. Equal items cancel out as a multiset; the
+    # rest are paired up in sorted order.
+    a_keyed = sorted(((_canonical(item), item) for item in a), key=lambda pair: pair[0])
+    b_keyed = sorted(((_canonical(item), item) for item in b), key=lambda pair: pair[0])
+    b_counts = Counter(key for key, _ in b_keyed)
+    matched = {key: min(count, b_counts[key]) for key, count in Counter(key for key, _ in a_keyed).items()}
+
+    a_left = _unmatched(a_keyed, matched)
+    b_left = _unmatched(b_keyed, matched)
+    for (index, a_item), (_, b_item) in zip(a_left, b_left):
+        yield from _diff(a_item, b_item, path + (index,), ignore)
+    for index, item in a_left[len(b_left):]:
+        yield path + (index,), 'iterable_item_removed', item, None
+    for index, item in b_left[len(a_left):]:
+        yield path + (index,), 'iterable_item_added', None, item
+
+
+def _group_differences(differences: Iterator[Tuple[SchemaPath, str, Any, Any]]) -> Dict[str, Any]:
+    """Group _diff() output by kind, in the same shape as DeepDiff.to_dict()."""
+    grouped: Dict[str, Dict[str, Any]] = {}
+
+    for path, kind, old, new in differences:
+        if kind == 'values_changed':
+            detail = {'new_value': new, 'old_value': old}
+        elif kind == 'type_changes':
+            detail = {
+                'old_type': type(old).__name__,
+                'new_type': type(new).__name__,
+                'old_value': old,
+                'new_value': new
+            }
+        elif kind.endswith('_added'):
+            detail = new
+        else:
+            detail = old
+        grouped.setdefault(kind, {})[_format_path(path)] = detail
+
+    return grouped
+
+
+def _log_schema(level: int, message: str, schema_name: str, client: Optional[str]):
+    """Log message with a %s placeholder for the schema label.
+
+    The "client/schema" label is only built when the level is enabled.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, f"{client}/{schema_name}" if client else schema_name)
+
+
+def _root_view(
+    schema: Dict[str, Any],
+    ignore: FrozenSet[SchemaPath],
+    defaults: Tuple[Tuple[SchemaPath, Any], ...]
+) -> Dict[str, Any]:
+    """Shallow view of a schema's top level with normalization rules applied.
+
+    Ignored top-level fields are dropped, defaults are filled in where
+    missing, and 'class' is normalized to 'name' for v3/v4 compatibility
+    (both refer to the collection name; if both exist, 'name' wins).
+    Values are shared with the input, not copied.
+    """
+    view = {}
+    for key, value in schema.items():
+        if (key,) in ignore:
+            continue
+        if key == 'class':
+            if 'name' in schema:
+                continue
+            key = 'name'
+        view[key] = value
+
+    for path, default in defaults:
+        view = _with_default(view, path, default)
+    return view
+
+
 class SchemaComparator:
     """Compares two schema configurations and reports differences."""
 
@@ -27,9 +244,22 @@ class SchemaComparator:
         "invertedIndexConfig.indexTimestamps": False,
     }
 
-    def __init__(self):
-        """Initialize the comparator."""
-        pass
+    # The rules above, parsed once into key paths
+    _IGNORE_PATHS = frozenset(_parse_path(path) for path in IGNORE_FIELDS)
+    _DEFAULTS_COMPILED = tuple(
+        (tuple(path.split('.')), value) for path, value in DEFAULT_VALUES.items()
+    )
+
+    def __init__(self, exhaustive: bool = False):
+        """Initialize the comparator.
+
+        Args:
+            exhaustive: Use DeepDiff instead of the built-in structural diff.
+                Much slower; meant for debugging the comparator itself.
+        """
+        self.exhaustive = exhaustive
+        # path -> (mtime_ns, parsed schema), see load_file()
+        self._json_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
     def normalize_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize a schema by removing internal fields and applying defaults.
@@ -40,19 +270,8 @@ class SchemaComparator:
         Returns:
             Normalized schema dictionary
         """
-        normalized = json.loads(json.dumps(schema))  # Deep copy
-
-        # Remove timestamp fields
-        normalized.pop('creationTimeUnix', None)
-        normalized.pop('lastUpdateTimeUnix', None)
-
-        # Normalize 'class' to 'name' for v3/v4 compatibility
-        # Both fields refer to the collection name
-        if 'class' in normalized and 'name' not in normalized:
-            normalized['name'] = normalized.pop('class')
-        elif 'class' in normalized and 'name' in normalized:
-            # If both exist, remove 'class' and keep 'name'
-            normalized.pop('class')
+        view = _root_view(schema, self._IGNORE_PATHS, self._DEFAULTS_COMPILED)
+        normalized = {key: _copy_json(value) for key, value in view.items()}
 
         # Sort properties by name for consistent comparison
         if 'properties' in normalized:
@@ -67,11 +286,80 @@ class SchemaComparator:
 
         return normalized
 
+    def load_file(self, path: Path) -> Dict[str, Any]:
+        """Load a schema JSON file, caching the parsed result.
+
+        Meant for files compared repeatedly, such as baselines. The cache is
+        keyed by path and invalidated when the file's mtime changes. The
+        schema is returned as parsed (compare_schemas normalizes on the fly)
+        and is shared between callers, so it must not be mutated.
+
+        Args:
+            path: Path to schema JSON
+
+        Returns:
+            Parsed schema dictionary
+        """
+        key = os.fspath(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        schema = load_json(key)
+        self._json_cache[key] = (mtime_ns, schema)
+        return schema
+
+    def _normalized_diff(
+        self,
+        baseline: Dict[str, Any],
+        exported: Dict[str, Any]
+    ) -> Iterator[Tuple[SchemaPath, str, Any, Any]]:
+        """Diff two raw schemas, applying the normalization rules on the way.
+
+        Root fields are filtered, aliased and defaulted through a shallow
+        view, and _diff() already matches properties by name and dict keys
+        regardless of order, so neither schema is copied.
+        """
+        ignore = self._IGNORE_PATHS
+        defaults = self._DEFAULTS_COMPILED
+        return _diff(
+            _root_view(baseline, ignore, defaults),
+            _root_view(exported, ignore, defaults),
+            ignore=ignore
+        )
+
+    def _deepdiff(self, baseline: Dict[str, Any], exported: Dict[str, Any]) -> Dict[str, Any]:
+        """Diff two normalized schemas with DeepDiff.
+
+        Normalized schemas with identical canonical JSON (the common case)
+        never reach DeepDiff. Unlike ==, which treats 1, 1.0 and True as
+        equal, the JSON text keeps those types apart.
+        """
+        if _canonical(baseline) == _canonical(exported):
+            return {}
+
+        from deepdiff import DeepDiff
+
+        diff = DeepDiff(
+            baseline,
+            exported,
+            exclude_paths=self.IGNORE_FIELDS,
+            ignore_order=True,
+            report_repetition=True,
+            verbose_level=2
+        )
+        # to_dict() holds type objects in type_changes; the JSON form has
+        # their names, like _group_differences(), so reports can serialize it
+        return json.loads(diff.to_json())
+
     def compare_schemas(
         self,
         baseline: Dict[str, Any],
         exported: Dict[str, Any],
-        schema_name: str = "schema"
+        schema_name: str = "schema",
+        client: Optional[str] = None
     ) -> Tuple[bool, Dict[str, Any]]:
         """Compare two schemas and report differences.
 
@@ -79,33 +367,30 @@ class SchemaComparator:
             baseline: Baseline schema (source of truth)
             exported: Exported schema to compare
             schema_name: Name of schema for reporting
+            client: Optional client name, reported as "client/schema_name"
 
         Returns:
             Tuple of (is_identical, differences_dict)
         """
-        logger.info(f"Comparing schemas for: {schema_name}")
-
-        # Normalize both schemas
-        norm_baseline = self.normalize_schema(baseline)
-        norm_exported = self.normalize_schema(exported)
+        _log_schema(logging.INFO, "Comparing schemas for: %s", schema_name, client)
 
         # Deep comparison
-        diff = DeepDiff(
-            norm_baseline,
-            norm_exported,
-            ignore_order=True,
-            report_repetition=True,
-            verbose_level=2
-        )
+        if self.exhaustive:
+            differences = self._deepdiff(
+                self.normalize_schema(baseline),
+                self.normalize_schema(exported)
+            )
+        else:
+            differences = _group_differences(self._normalized_diff(baseline, exported))
 
-        if not diff:
-            logger.info(f"✓ Schemas match perfectly: {schema_name}")
+        if not differences:
+            _log_schema(logging.INFO, "✓ Schemas match perfectly: %s", schema_name, client)
             return True, {}
 
-        logger.warning(f"✗ Schemas differ: {schema_name}")
-        logger.debug(f"Differences: {diff}")
+        _log_schema(logging.WARNING, "✗ Schemas differ: %s", schema_name, client)
+        logger.debug("Differences: %s", differences)
 
-        return False, diff.to_dict()
+        return False, differences
 
     def generate_comparison_report(
         self,
@@ -139,7 +424,7 @@ class SchemaComparator:
                 if not comp['match']:
                     report.append(f"### {comp['schema_name']}\n")
                     report.append(f"**Differences:**\n")
-                    report.append(f"```json\n{json.dumps(comp['differences'], indent=2)}\n```\n")
+                    report.append(f"```json\n{dumps(comp['differences'])}\n```\n")
 
         report_text = "\n".join(report)
 
@@ -170,10 +455,7 @@ class SchemaComparator:
         if schema_name is None:
             schema_name = baseline_path.parent.name
 
-        with open(baseline_path) as f:
-            baseline = json.load(f)
-
-        with open(exported_path) as f:
-            exported = json.load(f)
+        baseline = self.load_file(baseline_path)
+        exported = load_json(exported_path)
 
         return self.compare_schemas(baseline, exported, schema_name)
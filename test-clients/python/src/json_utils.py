@@ -0,0 +1,35 @@
+"""JSON helpers that use orjson when available and the stdlib otherwise."""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document; bytes are parsed without decoding first."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Union[str, os.PathLike]) -> Any:
+    """Read and parse a JSON file as raw bytes, skipping text decoding."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj as a JSON string indented by two spaces."""
+    return dumps_bytes(obj).decode()
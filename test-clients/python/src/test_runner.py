@@ -1,15 +1,36 @@
 """Test runner for importing and exporting Weaviate schemas."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 import weaviate
 from weaviate.classes.config import Configure, Property, DataType, VectorDistances
 
+from json_utils import dumps_bytes, load_json
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Enum members resolved by name, filled on first use
+_DATATYPE_CACHE: Dict[str, DataType] = {}
+_DISTANCE_CACHE: Dict[str, VectorDistances] = {}
+
+
+def _resolve_data_type(name: str) -> DataType:
+    """Resolve an upper-cased data type name (e.g. 'TEXT') to a DataType."""
+    data_type = _DATATYPE_CACHE.get(name)
+    if data_type is None:
+        data_type = _DATATYPE_CACHE[name] = getattr(DataType, name)
+    return data_type
+
+
+def _resolve_distance(name: str) -> VectorDistances:
+    """Resolve an upper-cased distance name (e.g. 'COSINE') to a VectorDistances."""
+    distance = _DISTANCE_CACHE.get(name)
+    if distance is None:
+        distance = _DISTANCE_CACHE[name] = getattr(VectorDistances, name)
+    return distance
+
 
 class TestRunner:
     """Runs import/export tests for Weaviate schemas."""
@@ -47,8 +68,7 @@ class TestRunner:
         Returns:
             Schema dictionary
         """
-        with open(schema_path) as f:
-            schema = json.load(f)
+        schema = load_json(schema_path)
         logger.info(f"Loaded schema from: {schema_path}")
         return schema
 
@@ -77,74 +97,59 @@ class TestRunner:
         logger.info(f"Importing collection: {collection_name}")
 
         # Build properties
-        properties = []
-        for prop in schema.get('properties', []):
-            data_type_str = prop['dataType'][0].upper()
-            data_type = getattr(DataType, data_type_str)
-
-            properties.append(
-                Property(
-                    name=prop['name'],
-                    data_type=data_type,
-                    description=prop.get('description')
-                )
+        properties = [
+            Property(
+                name=prop['name'],
+                data_type=_resolve_data_type(prop['dataType'][0].upper()),
+                description=prop.get('description')
             )
+            for prop in schema.get('properties', ())
+        ]
 
         # Handle vector configuration
         vector_config = None
 
         if 'vectorConfig' in schema and schema['vectorConfig']:
             # Multi-named vectors or single named vector
-            vector_configs = {}
+            self_provided = Configure.Vectors.self_provided
+            hnsw = Configure.VectorIndex.hnsw
+            vector_config = []
 
             for vector_name, vector_def in schema['vectorConfig'].items():
                 # Support both 'distanceMetric' (exported) and 'distance' (definition) keys
                 vector_index_config = vector_def.get('vectorIndexConfig', {})
                 distance_str = vector_index_config.get('distanceMetric') or vector_index_config.get('distance', 'cosine')
-                distance = getattr(VectorDistances, distance_str.upper())
 
-                vector_configs[vector_name] = Configure.Vectors.self_provided(
-                    name=vector_name,
-                    vector_index_config=Configure.VectorIndex.hnsw(
-                        distance_metric=distance
+                vector_config.append(
+                    self_provided(
+                        name=vector_name,
+                        vector_index_config=hnsw(
+                            distance_metric=_resolve_distance(distance_str.upper())
+                        )
                     )
                 )
 
-            # For multiple named vectors, pass the list of configs directly
-            vector_config = list(vector_configs.values())
-
         # Create collection
         try:
-            if vector_config:
-                collection = self.client.collections.create(
-                    name=collection_name,
-                    description=schema.get('description'),
-                    properties=properties,
-                    vector_config=vector_config,
-                    replication_config=Configure.replication(
-                        factor=schema.get('replicationConfig', {}).get('factor', 1)
-                    ),
-                    inverted_index_config=Configure.inverted_index(
-                        index_null_state=schema.get('invertedIndexConfig', {}).get('indexNullState', False),
-                        index_property_length=schema.get('invertedIndexConfig', {}).get('indexPropertyLength', False),
-                        index_timestamps=schema.get('invertedIndexConfig', {}).get('indexTimestamps', False)
-                    )
-                )
-            else:
-                # Collection without vectors
-                collection = self.client.collections.create(
-                    name=collection_name,
-                    description=schema.get('description'),
-                    properties=properties,
-                    replication_config=Configure.replication(
-                        factor=schema.get('replicationConfig', {}).get('factor', 1)
-                    ),
-                    inverted_index_config=Configure.inverted_index(
-                        index_null_state=schema.get('invertedIndexConfig', {}).get('indexNullState', False),
-                        index_property_length=schema.get('invertedIndexConfig', {}).get('indexPropertyLength', False),
-                        index_timestamps=schema.get('invertedIndexConfig', {}).get('indexTimestamps', False)
-                    )
+            # Only the vector config differs between collections with and without vectors
+            inverted_index = schema.get('invertedIndexConfig', {})
+            create_kwargs = dict(
+                name=collection_name,
+                description=schema.get('description'),
+                properties=properties,
+                replication_config=Configure.replication(
+                    factor=schema.get('replicationConfig', {}).get('factor', 1)
+                ),
+                inverted_index_config=Configure.inverted_index(
+                    index_null_state=inverted_index.get('indexNullState', False),
+                    index_property_length=inverted_index.get('indexPropertyLength', False),
+                    index_timestamps=inverted_index.get('indexTimestamps', False)
                 )
+            )
+            if vector_config:
+                create_kwargs['vector_config'] = vector_config
+
+            self.client.collections.create(**create_kwargs)
 
             logger.info(f"Successfully imported collection: {collection_name}")
             return collection_name
@@ -186,8 +191,7 @@ class TestRunner:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(schema, f, indent=2)
+        output_path.write_bytes(dumps_bytes(schema))
 
         logger.info(f"Saved schema to: {output_path}")
 
@@ -211,7 +215,8 @@ class TestRunner:
         self,
         baseline_path: Path,
         output_dir: Path,
-        schema_name: str
+        schema_name: str,
+        baseline: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Run a complete import/export test.
 
@@ -219,6 +224,8 @@ class TestRunner:
             baseline_path: Path to baseline schema JSON
             output_dir: Directory to save exported schema
             schema_name: Name of the schema being tested
+            baseline: Already-loaded baseline schema; baseline_path is only
+                read when this is not given
 
         Returns:
             Test result dictionary
@@ -232,7 +239,8 @@ class TestRunner:
 
         try:
             # Load baseline
-            baseline = self.load_schema(baseline_path)
+            if baseline is None:
+                baseline = self.load_schema(baseline_path)
 
             # Import schema
             collection_name = self.import_schema(baseline)
@@ -1,6 +1,6 @@
 """Pytest tests for schema import/export validation."""
 
-import json
+import os
 import pytest
 from pathlib import Path
 import sys
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from test_runner import TestRunner
 from comparator import SchemaComparator
+from json_utils import dumps, load_json
 
 
 # Get project root
@@ -35,6 +36,18 @@ def weaviate_client():
     runner.disconnect()
 
 
+@pytest.fixture(scope="session")
+def baselines():
+    """Load every baseline schema once for the test session."""
+    loaded = {}
+    with os.scandir(SCHEMAS_DIR) as entries:
+        for entry in entries:
+            config_path = os.path.join(entry.path, "config.json")
+            if entry.is_dir() and os.path.isfile(config_path):
+                loaded[entry.name] = load_json(config_path)
+    return loaded
+
+
 @pytest.fixture(scope="function")
 def cleanup_collections(weaviate_client):
     """Ensure clean state between tests."""
@@ -43,7 +56,7 @@ def cleanup_collections(weaviate_client):
 
 
 @pytest.mark.parametrize("schema_name", P0_SCHEMAS)
-def test_schema_import_export(schema_name, weaviate_client, cleanup_collections):
+def test_schema_import_export(schema_name, baselines, weaviate_client, cleanup_collections):
     """Test that a schema can be imported and re-exported identically.
 
     This test:
@@ -57,32 +70,30 @@ def test_schema_import_export(schema_name, weaviate_client, cleanup_collections)
     output_dir = RESULTS_DIR / "exported-schemas"
 
     # Verify baseline exists
-    assert baseline_path.exists(), f"Baseline schema not found: {baseline_path}"
+    assert schema_name in baselines, f"Baseline schema not found: {baseline_path}"
+    baseline = baselines[schema_name]
 
     # Run test
     result = weaviate_client.run_test(
         baseline_path=baseline_path,
         output_dir=output_dir,
-        schema_name=schema_name
+        schema_name=schema_name,
+        baseline=baseline
     )
 
     # Verify test succeeded
     assert result['success'], f"Import/export failed: {result.get('error')}"
     assert result['exported_path'], "No exported path returned"
 
-    # Load baseline and exported
-    with open(baseline_path) as f:
-        baseline = json.load(f)
-
-    with open(result['exported_path']) as f:
-        exported = json.load(f)
+    # Load exported
+    exported = load_json(result['exported_path'])
 
     # Compare schemas
     comparator = SchemaComparator()
     match, differences = comparator.compare_schemas(baseline, exported, schema_name)
 
     # Assert schemas match
-    assert match, f"Schema mismatch for {schema_name}:\n{json.dumps(differences, indent=2)}"
+    assert match, f"Schema mismatch for {schema_name}:\n{dumps(differences)}"
 
 
 def test_all_schemas_exist():
@@ -96,6 +107,124 @@ def test_all_schemas_exist():
     assert not missing, f"Missing baseline schemas: {missing}"
 
 
+def _schema(**overrides):
+    """Minimal schema with two properties, for comparator tests."""
+    schema = {
+        "name": "Article",
+        "properties": [
+            {"name": "title", "dataType": ["text"]},
+            {"name": "body", "dataType": ["text"]},
+        ],
+        "vectorIndexConfig": {"distance": "cosine", "ef": 64},
+    }
+    schema.update(overrides)
+    return schema
+
+
+def test_comparator_ignores_property_order():
+    """Properties are matched by name, not position."""
+    baseline = _schema()
+    exported = _schema(properties=list(reversed(baseline["properties"])))
+
+    assert SchemaComparator().compare_schemas(baseline, exported) == (True, {})
+
+
+@pytest.mark.parametrize("names", [("a", "a"), (None, None), ("a", 1)])
+def test_comparator_matches_items_without_unique_names_by_content(names):
+    """Duplicate, null or mixed-type names fall back to order-free content matching."""
+    items = [{"name": name, "dataType": [data_type]} for name, data_type in zip(names, ["text", "int"])]
+    baseline = _schema(properties=items)
+    exported = _schema(properties=list(reversed(items)))
+
+    assert SchemaComparator().compare_schemas(baseline, exported) == (True, {})
+
+    changed = _schema(properties=[items[0], {**items[1], "dataType": ["number"]}])
+    match, differences = SchemaComparator().compare_schemas(baseline, changed)
+    assert not match
+    assert list(differences) == ["values_changed"]
+
+
+def test_comparator_reports_added_and_removed_properties():
+    """Extra and missing properties are reported as iterable items."""
+    baseline = _schema()
+    extra = {"name": "author", "dataType": ["text"]}
+    exported = _schema(properties=baseline["properties"] + [extra])
+
+    match, differences = SchemaComparator().compare_schemas(baseline, exported)
+    assert not match
+    assert list(differences) == ["iterable_item_added"]
+    assert list(differences["iterable_item_added"].values()) == [extra]
+
+    match, differences = SchemaComparator().compare_schemas(exported, baseline)
+    assert not match
+    assert list(differences) == ["iterable_item_removed"]
+    assert list(differences["iterable_item_removed"].values()) == [extra]
+
+
+def test_comparator_reports_value_and_type_changes():
+    """Changed scalars are values_changed; changed types are type_changes."""
+    baseline = _schema()
+    exported = _schema(vectorIndexConfig={"distance": "dot", "ef": "64"})
+
+    match, differences = SchemaComparator().compare_schemas(baseline, exported)
+    assert not match
+    assert differences["values_changed"] == {
+        "root['vectorIndexConfig']['distance']": {"new_value": "dot", "old_value": "cosine"}
+    }
+    assert differences["type_changes"]["root['vectorIndexConfig']['ef']"]["old_type"] == "int"
+    assert differences["type_changes"]["root['vectorIndexConfig']['ef']"]["new_type"] == "str"
+
+
+def test_exhaustive_comparator_reports_serializable_type_changes():
+    """The DeepDiff mode reports type names, so differences serialize to JSON."""
+    baseline = _schema(replicationConfig={"factor": 1})
+    exported = _schema(replicationConfig={"factor": "1"})
+
+    match, differences = SchemaComparator(exhaustive=True).compare_schemas(baseline, exported)
+    assert not match
+    assert differences == SchemaComparator().compare_schemas(baseline, exported)[1]
+    dumps(differences)
+
+
+@pytest.mark.parametrize("baseline_value, exported_value", [(1, True), (0, False), (1, 1.0)])
+def test_comparator_reports_numeric_and_bool_type_changes(baseline_value, exported_value):
+    """Values Python considers equal (1 == True == 1.0) still differ in type."""
+    baseline = _schema(replicationConfig={"factor": baseline_value})
+    exported = _schema(replicationConfig={"factor": exported_value})
+
+    for comparator in (SchemaComparator(), SchemaComparator(exhaustive=True)):
+        match, differences = comparator.compare_schemas(baseline, exported)
+        assert not match
+        assert list(differences) == ["type_changes"]
+        assert list(differences["type_changes"]) == ["root['replicationConfig']['factor']"]
+
+
+def test_comparator_aliases_class_to_name():
+    """A v3-style 'class' field matches a v4-style 'name' field."""
+    baseline = _schema()
+    exported = _schema()
+    exported["class"] = exported.pop("name")
+
+    assert SchemaComparator().compare_schemas(baseline, exported) == (True, {})
+
+
+def test_comparator_ignores_timestamps():
+    """Creation and update timestamps never count as differences."""
+    baseline = _schema(creationTimeUnix=1, lastUpdateTimeUnix=2)
+    exported = _schema(creationTimeUnix=3)
+
+    assert SchemaComparator().compare_schemas(baseline, exported) == (True, {})
+
+
+def test_comparator_ignores_dict_key_order_in_unnamed_lists():
+    """Unnamed list items match regardless of their key order, like DeepDiff."""
+    baseline = _schema(moduleConfig=[{"d": 1, "a": 2}, {"c": 0}])
+    exported = _schema(moduleConfig=[{"c": 0}, {"a": 2, "d": 1}])
+
+    assert SchemaComparator().compare_schemas(baseline, exported) == (True, {})
+    assert SchemaComparator(exhaustive=True).compare_schemas(baseline, exported) == (True, {})
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])
@@ -1,44 +1,481 @@
 #!/usr/bin/env python3
 """Check for Weaviate client version updates."""
 
+import asyncio
+import functools
 import json
+import os
+import re
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 import argparse
-import requests
+import httpx
+from packaging.utils import (
+    InvalidSdistFilename,
+    InvalidWheelFilename,
+    parse_sdist_filename,
+    parse_wheel_filename,
+)
+from packaging.version import InvalidVersion, Version
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib codec
+    orjson = None
 
-def check_pypi_version(package_name: str) -> str:
-    """Check latest version on PyPI."""
-    url = f"https://pypi.org/pypi/{package_name}/json"
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Seconds allowed for each registry request
+REQUEST_TIMEOUT = 10.0
+
+# One pooled client serves every lookup, so connections to each registry
+# host are opened once and kept alive for the rest of the run. Over HTTP/2,
+# concurrent lookups to the same host share a single connection.
+POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+# Registry endpoints, formatted with the package name
+PYPI_SIMPLE_URL = "https://pypi.org/simple/{}/"
+PYPI_JSON_URL = "https://pypi.org/pypi/{}/json"
+NPM_PACKUMENT_URL = "https://registry.npmjs.org/{}"
+NPM_LATEST_URL = "https://registry.npmjs.org/{}/latest"
+NPM_LATEST_HEADERS: Dict[str, str] = {}
+
+# PEP 691 JSON form of the Simple index: a version list and file names,
+# a fraction of the size of the full /pypi/<name>/json document
+PYPI_SIMPLE_JSON = 'application/vnd.pypi.simple.v1+json'
+PYPI_SIMPLE_HEADERS = {'Accept': PYPI_SIMPLE_JSON}
+
+# "version" key of an npm version document; it comes right after "name"
+NPM_VERSION_PATTERN = re.compile(rb'"version"\s*:\s*"([^"]+)"')
+
+# npm packument with only install metadata per version
+NPM_ABBREVIATED_JSON = 'application/vnd.npm.install-v1+json'
+NPM_PACKUMENT_HEADERS = {'Accept': NPM_ABBREVIATED_JSON}
+
+# Concurrent requests allowed per registry host, so a large fan-out does
+# not trip rate limiting
+HOST_CONCURRENCY = 8
+
+# Throttled (429) and server error responses are retried with exponential
+# backoff, or after the delay the registry asks for in Retry-After (capped
+# at RETRY_MAX_DELAY seconds)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5
+RETRY_MAX_DELAY = 10.0
+
+# Registry lookups are cached on disk between runs for this many seconds
+DEFAULT_CACHE_TTL = 600
+DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'weaviate-version-check.json'
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document from raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json(path: Path) -> Any:
+    """Read and parse a JSON file as raw bytes."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _write_json(path: Path, data: Any):
+    """Write data as JSON atomically, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(_dumps(data))
+    os.replace(tmp_path, path)
+
+
+class RegistryResult(NamedTuple):
+    """Latest version of a package plus the response validators seen with it."""
+
+    latest: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # Lookup the validators came from, see _validator_scope()
+    validated_for: Optional[str]
+
+
+def _validator_scope(url: str, track: Optional[str]) -> str:
+    """Identify the lookup a response's validators belong to.
+
+    The track is included because one URL can serve several lookups: the
+    PyPI Simple index lists every release line, so a 304 for it says
+    nothing about which release a different track would pick.
+    """
+    return f"{url}@{track}" if track else url
+
+
+def _request_headers(info: dict, scope: str, base: Dict[str, str]) -> Dict[str, str]:
+    """Add If-None-Match / If-Modified-Since from a client's stored validators.
+
+    Validators are only sent when the entry records the latest version they
+    belong to, since a 304 response reuses it, and when they were stored
+    for this same lookup scope. Otherwise the shared base headers are
+    returned as they are.
+    """
+    if not info.get('latest') or info.get('validated_for') != scope:
+        return base
+
+    validators = {}
+    if info.get('etag'):
+        validators['If-None-Match'] = info['etag']
+    if info.get('last_modified'):
+        validators['If-Modified-Since'] = info['last_modified']
+    return {**base, **validators} if validators else base
+
+
+def _unchanged(info: dict) -> RegistryResult:
+    """Result for a 304 Not Modified response: the stored entry still holds."""
+    return RegistryResult(info['latest'], info.get('etag'), info.get('last_modified'), info['validated_for'])
+
+
+def _fetched(response: httpx.Response, latest: str, scope: str) -> RegistryResult:
+    """Result for a full response, keeping its validators for the next run."""
+    return RegistryResult(
+        latest,
+        response.headers.get('ETag'),
+        response.headers.get('Last-Modified'),
+        scope
+    )
+
+
+# Parsed versions, memoized since the same strings recur across clients and runs
+_parse_version = functools.lru_cache(maxsize=512)(Version)
+
+
+def _is_newer(latest: str, current: str) -> bool:
+    """Whether latest is a newer version than current.
+
+    Versions are compared as PEP 440 versions, so "1.2" equals "1.2.0";
+    strings that do not parse fall back to plain inequality.
+    """
+    try:
+        return _parse_version(latest) > _parse_version(current)
+    except InvalidVersion:
+        return latest != current
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying response, honoring Retry-After seconds."""
     try:
-        response = requests.get(url, timeout=10)
+        delay = float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        delay = RETRY_BACKOFF * 2 ** attempt
+    return min(delay, RETRY_MAX_DELAY)
+
+
+async def _get(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    url: str,
+    headers: Optional[Dict[str, str]] = None
+) -> httpx.Response:
+    """GET url within the host's concurrency limit, retrying throttled requests.
+
+    Returns:
+        The first non-retryable response, or the last one once retries run out
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        async with limit:
+            response = await client.get(url, headers=headers)
+        if response.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+            return response
+        # Back off outside the limit so other requests to the host can proceed
+        await asyncio.sleep(_retry_delay(response, attempt))
+
+
+def _npm_document_version(content: bytes) -> str:
+    """Read the top-level "version" of an npm version document.
+
+    The field is found with a regex near the start of the document, so the
+    rest (dist, dependency maps, ...) is never parsed. A match nested inside
+    another object is rejected in favor of a full parse.
+    """
+    match = NPM_VERSION_PATTERN.search(content)
+    if match and content.count(b'{', 0, match.start()) - content.count(b'}', 0, match.start()) == 1:
+        return match.group(1).decode()
+    return _loads(content)['version']
+
+
+def _file_version(filename: str) -> Optional[Version]:
+    """Version of a wheel or sdist file name, or None if it cannot be parsed."""
+    try:
+        if filename.endswith('.whl'):
+            return parse_wheel_filename(filename)[1]
+        return parse_sdist_filename(filename)[1]
+    except (InvalidWheelFilename, InvalidSdistFilename, InvalidVersion):
+        return None
+
+
+def _yanked_versions(files: List[Dict[str, Any]]) -> Set[Version]:
+    """Versions whose every file in a Simple index listing is yanked."""
+    yanked: Dict[Version, bool] = {}
+    for file in files:
+        version = _file_version(file['filename'])
+        if version is not None:
+            yanked[version] = yanked.get(version, True) and bool(file.get('yanked'))
+    return {version for version, all_yanked in yanked.items() if all_yanked}
+
+
+def _latest_release(
+    versions: Iterable[str],
+    yanked: Set[Version],
+    track: Optional[str] = None
+) -> Optional[str]:
+    """Highest non-yanked final release, or pre-release if there is no final one.
+
+    Matches how PyPI picks the version shown in its JSON API. With track
+    (e.g. "4" or "4.2"), only versions on that release line are considered.
+    """
+    prefix = Version(track).release if track else ()
+    releases = []
+    for version in versions:
+        try:
+            parsed = Version(version)
+        except InvalidVersion:
+            continue
+        if parsed not in yanked and parsed.release[:len(prefix)] == prefix:
+            releases.append((parsed, version))
+
+    final = [release for release in releases if not release[0].is_prerelease]
+    candidates = final or releases
+    return max(candidates)[1] if candidates else None
+
+
+async def check_pypi_version(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    info: dict
+) -> Optional[RegistryResult]:
+    """Check latest version on PyPI.
+
+    Uses the Simple index JSON, falling back to the full project JSON for
+    indexes that do not serve it.
+    """
+    package_name = info['package_name']
+    track = info.get('track')
+    try:
+        url = PYPI_SIMPLE_URL.format(package_name)
+        scope = _validator_scope(url, track)
+        response = await _get(client, limit, url, _request_headers(info, scope, PYPI_SIMPLE_HEADERS))
+        if response.status_code == 304:
+            return _unchanged(info)
         response.raise_for_status()
-        data = response.json()
-        return data['info']['version']
+
+        if response.headers.get('Content-Type', '').startswith(PYPI_SIMPLE_JSON):
+            data = _loads(response.content)
+            latest = _latest_release(data['versions'], _yanked_versions(data['files']), track)
+        else:
+            url = PYPI_JSON_URL.format(package_name)
+            scope = _validator_scope(url, track)
+            response = await _get(client, limit, url)
+            response.raise_for_status()
+            data = _loads(response.content)
+            if track:
+                files = [file for files in data['releases'].values() for file in files]
+                latest = _latest_release(data['releases'], _yanked_versions(files), track)
+            else:
+                latest = data['info']['version']
+
+        if not latest:
+            raise ValueError("no matching releases found")
+
+        return _fetched(response, latest, scope)
     except Exception as e:
         print(f"Error checking PyPI for {package_name}: {e}", file=sys.stderr)
         return None
 
 
-def check_npm_version(package_name: str) -> str:
-    """Check latest version on npm."""
-    url = f"https://registry.npmjs.org/{package_name}/latest"
+async def check_npm_version(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    info: dict
+) -> Optional[RegistryResult]:
+    """Check latest version on npm.
+
+    Tracked clients read the abbreviated packument, which lists every
+    version; the rest only need the document of the latest version.
+    """
+    package_name = info['package_name']
+    track = info.get('track')
     try:
-        response = requests.get(url, timeout=10)
+        if track:
+            url = NPM_PACKUMENT_URL.format(package_name)
+            base_headers = NPM_PACKUMENT_HEADERS
+        else:
+            url = NPM_LATEST_URL.format(package_name)
+            base_headers = NPM_LATEST_HEADERS
+        scope = _validator_scope(url, track)
+
+        response = await _get(client, limit, url, _request_headers(info, scope, base_headers))
+        if response.status_code == 304:
+            return _unchanged(info)
         response.raise_for_status()
-        data = response.json()
-        return data['version']
+
+        if not track:
+            return _fetched(response, _npm_document_version(response.content), scope)
+
+        latest = _latest_release(_loads(response.content)['versions'], set(), track)
+        if not latest:
+            raise ValueError("no matching releases found")
+        return _fetched(response, latest, scope)
     except Exception as e:
         print(f"Error checking npm for {package_name}: {e}", file=sys.stderr)
         return None
 
 
-def check_versions(versions_file: Path) -> dict:
-    """Check for version updates."""
-    with open(versions_file) as f:
-        versions = json.load(f)
+# Registry lookup per package manager
+CHECKERS = {
+    'pypi': check_pypi_version,
+    'npm': check_npm_version,
+}
+
+
+# (package manager, package name, track or '')
+LookupKey = Tuple[str, str, str]
+
+
+def _lookup_key(info: dict) -> Optional[LookupKey]:
+    """Registry lookup a client needs, or None for pinned/unsupported clients."""
+    if info.get('pin') or info['package_manager'] not in CHECKERS:
+        return None
+    return info['package_manager'], info['package_name'], info.get('track') or ''
+
+
+def _cache_key(package: LookupKey) -> str:
+    """Key of a lookup in the on-disk cache, e.g. "pypi:weaviate-client@4"."""
+    manager, name, track = package
+    return f"{manager}:{name}@{track}" if track else f"{manager}:{name}"
+
+
+def _check_key(versions_file: Path) -> str:
+    """Cache key recording when versions_file was last checked."""
+    return f"check:{versions_file.resolve()}"
+
+
+def load_cache(cache_file: Path) -> Dict[str, dict]:
+    """Load the on-disk lookup cache; a missing or unreadable file is empty."""
+    try:
+        return _load_json(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_file: Path, cache: Dict[str, dict]):
+    """Write the on-disk lookup cache."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(cache_file, cache)
+
+
+async def fetch_latest_versions(
+    clients: Dict[str, dict],
+    cache: Optional[Dict[str, dict]] = None,
+    cache_ttl: float = 0
+) -> Dict[str, Optional[RegistryResult]]:
+    """Look up the latest version of every client concurrently.
+
+    Each (package manager, package name, track) is looked up once, however
+    many clients name it. Pinned clients and clients with an unknown package
+    manager are left out.
+
+    Args:
+        clients: Client entries from versions.json
+        cache: Optional lookup cache, keyed by "manager:name" (plus "@track"
+            for tracked clients); fresh entries are used instead of a
+            request and new results are added to it
+        cache_ttl: Seconds a cache entry stays fresh
+
+    Returns:
+        Mapping of client name to lookup result (None if the lookup failed)
+    """
+    lookups = {name: _lookup_key(info) for name, info in clients.items()}
+
+    packages: Dict[LookupKey, dict] = {}
+    for name, package in lookups.items():
+        if package:
+            packages.setdefault(package, clients[name])
+
+    now = time.time()
+    results: Dict[LookupKey, Optional[RegistryResult]] = {}
+    pending = []
+    for package in packages:
+        entry = cache.get(_cache_key(package)) if cache is not None else None
+        if entry and now - entry['checked_at'] < cache_ttl:
+            results[package] = RegistryResult(
+                entry['latest'],
+                entry.get('etag'),
+                entry.get('last_modified'),
+                entry.get('validated_for')
+            )
+        else:
+            pending.append(package)
+
+    if pending:
+        # httpx advertises brotli in Accept-Encoding by itself when the
+        # brotli extra is installed, alongside gzip and deflate
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=REQUEST_TIMEOUT,
+            limits=POOL_LIMITS
+        ) as client:
+            # Each package manager talks to a single registry host
+            limits = {manager: asyncio.Semaphore(HOST_CONCURRENCY) for manager in CHECKERS}
+            fetched = await asyncio.gather(*(
+                CHECKERS[package[0]](client, limits[package[0]], packages[package])
+                for package in pending
+            ))
+
+        for package, result in zip(pending, fetched):
+            results[package] = result
+            if cache is not None and result:
+                cache[_cache_key(package)] = {'checked_at': now, **result._asdict()}
+
+    return {name: results[package] for name, package in lookups.items() if package}
+
+
+def check_versions(
+    versions_file: Path,
+    cache_file: Optional[Path] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL
+) -> dict:
+    """Check for version updates.
+
+    Args:
+        versions_file: Path to versions.json
+        cache_file: Optional on-disk cache of registry lookups, which also
+            records when versions_file was checked (see --max-age)
+        cache_ttl: Seconds a cached lookup is reused without a request
+    """
+    versions = _load_json(versions_file)
+
+    cache = load_cache(cache_file) if cache_file else None
+
+    # All lookups run at once; results are reported in versions.json order
+    latest_versions = asyncio.run(
+        fetch_latest_versions(versions['clients'], cache, cache_ttl)
+    )
+
+    if cache_file:
+        cache[_check_key(versions_file)] = {'checked_at': time.time()}
+        save_cache(cache_file, cache)
 
     updates = {}
 
@@ -49,18 +486,19 @@ def check_versions(versions_file: Path) -> dict:
 
         print(f"Checking {client} ({package_name})...")
 
-        if package_manager == 'pypi':
-            latest = check_pypi_version(package_name)
-        elif package_manager == 'npm':
-            latest = check_npm_version(package_name)
-        else:
+        if info.get('pin'):
+            # Pinned by policy: never looked up, never flagged
+            result = RegistryResult(current, None, None, None)
+        elif package_manager not in CHECKERS:
             print(f"Unknown package manager: {package_manager}", file=sys.stderr)
             continue
+        else:
+            result = latest_versions[client]
+            if not result:
+                continue
 
-        if not latest:
-            continue
-
-        update_available = latest != current
+        latest = result.latest
+        update_available = _is_newer(latest, current)
 
         updates[client] = {
             'current': current,
@@ -69,8 +507,22 @@ def check_versions(versions_file: Path) -> dict:
             'package_name': package_name,
             'package_manager': package_manager
         }
+        # Version policy carries over to the next run
+        for policy in ('pin', 'track'):
+            if policy in info:
+                updates[client][policy] = info[policy]
+        # Validators for a conditional request on the next run, and the
+        # lookup they were returned for
+        if result.etag:
+            updates[client]['etag'] = result.etag
+        if result.last_modified:
+            updates[client]['last_modified'] = result.last_modified
+        if result.etag or result.last_modified:
+            updates[client]['validated_for'] = result.validated_for
 
-        if update_available:
+        if info.get('pin'):
+            print(f"  📌 Pinned: {current}")
+        elif update_available:
             print(f"  ⚠️  Update available: {current} -> {latest}")
         else:
             print(f"  ✅ Up to date: {current}")
@@ -78,6 +530,12 @@ def check_versions(versions_file: Path) -> dict:
     return updates
 
 
+def _checked_within(cache_file: Path, versions_file: Path, max_age: float) -> bool:
+    """Whether versions_file was last checked less than max_age seconds ago."""
+    entry = load_cache(cache_file).get(_check_key(versions_file))
+    return bool(entry) and time.time() - entry['checked_at'] < max_age
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Check for client version updates")
@@ -92,6 +550,25 @@ def main():
         type=Path,
         help='Output path for updated versions (default: update in place)'
     )
+    parser.add_argument(
+        '--cache-file',
+        type=Path,
+        default=DEFAULT_CACHE_FILE,
+        help=f'Cache of registry lookups shared between runs (default: {DEFAULT_CACHE_FILE})'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f'Seconds a cached lookup is reused; 0 disables the cache (default: {DEFAULT_CACHE_TTL})'
+    )
+    parser.add_argument(
+        '--max-age',
+        type=float,
+        default=0,
+        help='Skip the check if the versions file was checked less than this many seconds ago, '
+             'as recorded in the cache file (default: 0, always check)'
+    )
 
     args = parser.parse_args()
 
@@ -102,18 +579,34 @@ def main():
         print(f"ERROR: Versions file not found: {versions_file}", file=sys.stderr)
         return 1
 
-    updates = check_versions(versions_file)
+    # The cache file also records when each versions file was last checked,
+    # so --max-age needs it even when cached lookups are not reused
+    cache_file = args.cache_file if args.cache_ttl > 0 or args.max_age > 0 else None
 
-    # Update versions file
-    updated_data = {
-        'last_updated': datetime.utcnow().isoformat() + 'Z',
-        'clients': updates
-    }
+    if args.max_age > 0 and _checked_within(cache_file, versions_file, args.max_age):
+        print(f"Versions file checked less than {args.max_age:g}s ago, skipping check")
+        return 0
+
+    updates = check_versions(versions_file, cache_file, args.cache_ttl)
+
+    try:
+        previous = _load_json(output_file)
+    except (OSError, ValueError):
+        previous = None
+
+    # Update versions file, leaving it untouched (including its mtime and
+    # last_updated) when no client entry changed
+    if previous is not None and previous.get('clients') == updates:
+        print(f"\nVersions unchanged in: {output_file}")
+    else:
+        updated_data = {
+            'last_updated': datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
+            'clients': updates
+        }
 
-    with open(output_file, 'w') as f:
-        json.dump(updated_data, f, indent=2)
+        _write_json(output_file, updated_data)
 
-    print(f"\nVersions updated in: {output_file}")
+        print(f"\nVersions updated in: {output_file}")
 
     # Check if any updates are available
     has_updates = any(info['update_available'] for info in updates.values())
@@ -0,0 +1,112 @@
+"""Pytest tests for the registry response parsing in check_versions."""
+
+import pytest
+from pathlib import Path
+import sys
+
+from packaging.version import Version
+
+# Add version-tracking to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from check_versions import (
+    NPM_LATEST_HEADERS,
+    PYPI_JSON_URL,
+    PYPI_SIMPLE_HEADERS,
+    PYPI_SIMPLE_URL,
+    _latest_release,
+    _npm_document_version,
+    _request_headers,
+    _validator_scope,
+    _yanked_versions,
+)
+
+
+SIMPLE_URL = PYPI_SIMPLE_URL.format("weaviate-client")
+
+
+def test_latest_release_prefers_final_releases():
+    """A newer pre-release does not beat the highest final release."""
+    assert _latest_release(["4.9.0", "4.10.0", "5.0.0b1"], set()) == "4.10.0"
+
+
+def test_latest_release_falls_back_to_prereleases():
+    """Without any final release, the highest pre-release is picked."""
+    assert _latest_release(["1.0.0a1", "1.0.0b2"], set()) == "1.0.0b2"
+
+
+def test_latest_release_skips_yanked_and_invalid_versions():
+    """Yanked versions and strings that are not PEP 440 versions are ignored."""
+    versions = ["4.9.0", "4.10.0", "not-a-version"]
+    assert _latest_release(versions, {Version("4.10.0")}) == "4.9.0"
+    assert _latest_release(["not-a-version"], set()) is None
+
+
+@pytest.mark.parametrize("track, expected", [("4", "4.10.0"), ("4.9", "4.9.1"), ("6", None)])
+def test_latest_release_follows_track(track, expected):
+    """A track limits the candidates to its release line."""
+    versions = ["4.9.0", "4.9.1", "4.10.0", "5.1.0"]
+    assert _latest_release(versions, set(), track) == expected
+
+
+def test_yanked_versions_requires_every_file_yanked():
+    """A version counts as yanked only if all of its files are."""
+    files = [
+        {"filename": "weaviate_client-4.9.0-py3-none-any.whl", "yanked": True},
+        {"filename": "weaviate_client-4.9.0.tar.gz", "yanked": "broken metadata"},
+        {"filename": "weaviate_client-4.10.0-py3-none-any.whl", "yanked": True},
+        {"filename": "weaviate_client-4.10.0.tar.gz", "yanked": False},
+        {"filename": "weaviate_client-4.11.0.tar.gz"},
+        {"filename": "weaviate-client.zip", "yanked": True},
+    ]
+    assert _yanked_versions(files) == {Version("4.9.0")}
+
+
+def test_npm_document_version_reads_top_level_version():
+    """The top-level version is read, even with nested "version" keys."""
+    content = b'{"name": "weaviate-client", "version": "3.2.0", "engines": {"version": "x"}}'
+    assert _npm_document_version(content) == "3.2.0"
+
+
+def test_npm_document_version_ignores_nested_matches():
+    """A nested "version" ahead of the top-level one falls back to a full parse."""
+    content = b'{"name": "weaviate-client", "peer": {"version": "1.0.0"}, "version": "3.2.0"}'
+    assert _npm_document_version(content) == "3.2.0"
+
+
+def test_request_headers_adds_validators_for_same_scope():
+    """Stored validators are sent for the lookup they were returned for."""
+    scope = _validator_scope(SIMPLE_URL, None)
+    info = {"latest": "5.1.0", "etag": '"abc"', "last_modified": "Mon", "validated_for": scope}
+
+    headers = _request_headers(info, scope, PYPI_SIMPLE_HEADERS)
+    assert headers == {**PYPI_SIMPLE_HEADERS, "If-None-Match": '"abc"', "If-Modified-Since": "Mon"}
+    assert "If-None-Match" not in PYPI_SIMPLE_HEADERS
+
+
+@pytest.mark.parametrize("info", [
+    # No latest version to reuse on 304
+    {"etag": '"abc"', "validated_for": SIMPLE_URL},
+    # Validators from before the client was tracked
+    {"latest": "5.1.0", "etag": '"abc"', "validated_for": SIMPLE_URL},
+    # Validators from another URL (the JSON API fallback)
+    {"latest": "5.1.0", "etag": '"abc"', "validated_for": PYPI_JSON_URL.format("weaviate-client")},
+    # Validators stored without a scope
+    {"latest": "5.1.0", "etag": '"abc"'},
+])
+def test_request_headers_skips_validators_for_other_lookups(info):
+    """Validators from a different or unknown lookup are never sent."""
+    scope = _validator_scope(SIMPLE_URL, "4")
+    assert _request_headers(info, scope, PYPI_SIMPLE_HEADERS) is PYPI_SIMPLE_HEADERS
+
+
+def test_request_headers_without_validators_returns_base():
+    """An entry without validators sends the base headers unchanged."""
+    scope = _validator_scope("https://registry.npmjs.org/weaviate-client/latest", None)
+    info = {"latest": "3.2.0", "validated_for": scope}
+    assert _request_headers(info, scope, NPM_LATEST_HEADERS) is NPM_LATEST_HEADERS
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v", "--tb=short"])